@@ -1,25 +1,43 @@
 """ fastapi 主文件"""
+from functools import lru_cache
 from typing import Any, Optional
 
+import orjson
 import sqlalchemy
 from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.routing import APIRoute
+from redis.asyncio import BlockingConnectionPool, Redis
 from starlette.middleware.cors import CORSMiddleware
 
 from public_server import api
+from public_server.middleware.rcache import RCacheMiddleware
 from public_server.schemas.response_info import RSINFO, NMCException, RespInfo, RFInfo
+from public_server.settings import (
+    CORS_ALLOW_CREDENTIALS,
+    CORS_ORIGINS,
+    RCACHE_TTL,
+    REDIS_HOST,
+    REDIS_MAX_CONNECTIONS,
+    REDIS_POOL_TIMEOUT,
+    REDIS_SOCKET_TIMEOUT,
+    REDIS_URL,
+)
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
+_ROOT_BODY = b"<h1 align='center'>Welcome To Base API</h1>"
+_DATA_EXIST_RESP = RFInfo.FAILED.with_message(message="数据已存在", reason="data exist")
 
-origins = ["*"]
 
+# 先注册的中间件在内层, 缓存命中的响应仍会经过 CORS
+if REDIS_HOST:
+    app.add_middleware(RCacheMiddleware, ttl=RCACHE_TTL)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
+    allow_origins=CORS_ORIGINS,
+    allow_credentials=CORS_ALLOW_CREDENTIALS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -29,13 +47,27 @@ app.include_router(api.router)
 async def startup():
     """启动时加载"""
     # await create_base_tables()
-    ...
+    if not REDIS_HOST:
+        return
+    # from_pool 让 aclose() 同时关闭连接池
+    app.state.redis = Redis.from_pool(
+        BlockingConnectionPool.from_url(
+            REDIS_URL,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            timeout=REDIS_POOL_TIMEOUT,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            decode_responses=False,
+        )
+    )
 
 
 async def shutdown():
     """关闭时处理"""
     # await base_engine.dispose()
-    ...
+    redis: Optional[Redis] = getattr(app.state, "redis", None)
+    if redis is not None:
+        await redis.aclose()
 
 
 app.add_event_handler("startup", startup)
@@ -43,9 +75,9 @@ app.add_event_handler("shutdown", shutdown)
 
 
 @app.get("/", response_class=HTMLResponse)
-async def root() -> str:
+async def root() -> Response:
     """index"""
-    return "<h1 align='center'>Welcome To Base API</h1>"
+    return Response(_ROOT_BODY, media_type="text/html")
 
 
 def use_route_names_as_operation_ids(application: FastAPI) -> None:
@@ -53,11 +85,14 @@ def use_route_names_as_operation_ids(application: FastAPI) -> None:
     Simplify operation IDs so that generated API clients have simpler function
     names.
 
-    Should be called only after all routes have been added.
+    Should be called only after all routes have been added: the route list is
+    frozen into a tuple afterwards, so later add_route calls will fail loudly.
     """
-    for route in application.routes:
+    routes = application.router.routes
+    for route in routes:
         if isinstance(route, APIRoute):
             route.operation_id = route.name
+    application.router.routes = tuple(routes)
 
 
 use_route_names_as_operation_ids(app)
@@ -76,7 +111,7 @@ def response_for_error(
          request: 导致错误的请求。如果这是无
 
     Returns:
-        JSONResponse: 包含错误信息的响应。
+        Response: 包含错误信息的 JSON 响应。
     """
     if isinstance(error, RespInfo):
         if exception is not None:
@@ -88,14 +123,16 @@ def response_for_error(
             pass
             # request.state.log_data[error.reason] = error.message
 
-        return JSONResponse(
-            {"code": error.code, "reason": error.reason, "message": error.message},
+        return Response(
+            error.json_bytes(),
             status_code=error.http_status,
+            media_type="application/json",
         )
     else:
-        return JSONResponse(
-            {"code": 0, "reason": str(error), "message": str(error)
-             }
+        reason = str(error)
+        return Response(
+            orjson.dumps({"code": 0, "reason": reason, "message": reason}),
+            media_type="application/json",
         )
 
 
@@ -105,10 +142,16 @@ async def validation_exception_handler(request: Request, e: RequestValidationErr
     return response_for_error(RSINFO.REQUEST_VALIDATION_ERROR)
 
 
+@lru_cache(maxsize=512)
+def _failed_resp(message: str) -> RespInfo:
+    """相同断言信息复用同一个 RespInfo, 其响应体由 json_bytes() 只序列化一次"""
+    return RFInfo.FAILED.with_message(message=message)
+
+
 @app.exception_handler(AssertionError)
 async def assert_exception_handler(request: Request, exc: AssertionError):
     """断言异常处理"""
-    return response_for_error(RFInfo.FAILED.with_message(message=str(exc)))
+    return response_for_error(_failed_resp(str(exc)))
 
 
 @app.exception_handler(NMCException)
@@ -120,6 +163,22 @@ async def http_exception_handler(request: Request, exc: NMCException):
 @app.exception_handler(sqlalchemy.exc.IntegrityError)
 async def integrity_exception_handler(request: Request, exc: sqlalchemy.exc.IntegrityError):
     """数据库错误常处理"""
-    if exc.code == 'gkpj':
-        return response_for_error(RFInfo.FAILED.with_message(message='数据已存在', reason="data exist"))
+    if exc.code == "gkpj":
+        return response_for_error(_DATA_EXIST_RESP)
     raise exc
+
+
+if __name__ == "__main__":
+    import sys
+
+    import uvicorn
+
+    # loop="uvloop" 在未安装 uvloop 时会直接启动失败, 避免静默回退到 asyncio;
+    # uvloop 不支持 Windows, 该平台使用 asyncio
+    uvicorn.run(
+        "public_server.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+    )
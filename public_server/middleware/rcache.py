@@ -0,0 +1,126 @@
+"""基于 redis 的 GET 响应缓存中间件"""
+import hashlib
+from typing import Dict, FrozenSet, Optional, Tuple
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+__all__ = ["RCacheMiddleware"]
+
+_MEDIA_TYPE = "application/json"
+# 缓存命中时由 Response 重新计算, 不需要存储
+_SKIP_HEADERS = frozenset({"content-length"})
+# 响应带有这些 Cache-Control 指令时不缓存
+_NO_STORE = frozenset({"no-store", "private"})
+
+
+def _pack(headers: Dict[str, str], body: bytes) -> bytes:
+    """将响应头和响应体打包为一个 redis 值: 一行 JSON 响应头 + 换行 + 响应体"""
+    return orjson.dumps(headers) + b"\n" + body
+
+
+def _unpack(value: bytes) -> Optional[Tuple[Dict[str, str], bytes]]:
+    """解析 _pack 打包的 redis 值, 格式不正确时返回 None"""
+    try:
+        headers, body = value.split(b"\n", 1)
+        headers = orjson.loads(headers)
+    except ValueError:
+        return None
+    if not isinstance(headers, dict):
+        return None
+    return headers, body
+
+
+def _cache_directives(value: str) -> FrozenSet[str]:
+    """解析 Cache-Control 头, 返回小写的指令名集合, e.g. "max-age=0, No-Cache" => {"max-age", "no-cache"}"""
+    return frozenset(d.split("=", 1)[0].strip().lower() for d in value.split(","))
+
+
+class RCacheMiddleware(BaseHTTPMiddleware):
+    """缓存 GET 请求的 JSON 响应体及响应头
+
+    redis 客户端从 ``app.state.redis`` 读取, 未初始化或 redis 不可用时直接透传请求。
+    需注册在 CORSMiddleware 之前, 使缓存命中的响应同样经过 CORS 处理。
+    带 set-cookie 或 ``Cache-Control: no-store/private`` 的响应不缓存;
+    请求带 ``Cache-Control: no-cache`` 时跳过缓存读取并刷新缓存, 带 ``no-store`` 时完全透传。
+    多值响应头只保留最后一个值。
+    """
+
+    def __init__(self: "RCacheMiddleware", app: ASGIApp, ttl: int = 300) -> None:
+        """Initialize the middleware.
+
+        Args:
+                app: The ASGI application to wrap.
+                ttl: Seconds a cached response body is kept in redis.
+        """
+        super().__init__(app)
+        self.ttl = ttl
+
+    @staticmethod
+    def cache_key(request: Request) -> str:
+        """Build the cache key for a request from its path, query and credentials.
+
+        Args:
+                request: The incoming request.
+
+        Returns:
+                The redis key, e.g. ``rcache:/blog/list?page=1:<auth digest>``.
+        """
+        auth = request.headers.get("authorization", "")
+        auth_id = hashlib.sha1(auth.encode()).hexdigest() if auth else ""
+        return f"rcache:{request.url.path}?{request.url.query}:{auth_id}"
+
+    async def dispatch(
+        self: "RCacheMiddleware", request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        """Serve GET requests from redis when cached, otherwise cache the response.
+
+        Args:
+                request: The incoming request.
+                call_next: The next handler in the middleware chain.
+
+        Returns:
+                The cached or freshly generated response.
+        """
+        redis: Optional[Redis] = getattr(request.app.state, "redis", None)
+        if redis is None or request.method != "GET":
+            return await call_next(request)
+        directives = _cache_directives(request.headers.get("cache-control", ""))
+        if "no-store" in directives:
+            return await call_next(request)
+
+        key = self.cache_key(request)
+        if "no-cache" not in directives:
+            try:
+                async with redis.pipeline(transaction=False) as pipe:
+                    cached, ttl = await pipe.get(key).ttl(key).execute()
+            except RedisError:
+                return await call_next(request)
+            unpacked = _unpack(cached) if cached is not None else None
+            if unpacked is not None:
+                headers, body = unpacked
+                if 0 <= ttl <= self.ttl:
+                    headers["age"] = str(self.ttl - ttl)
+                return Response(body, headers=headers)
+
+        response = await call_next(request)
+        if (
+            response.status_code != 200
+            or not response.headers.get("content-type", "").startswith(_MEDIA_TYPE)
+            or "set-cookie" in response.headers
+            or _NO_STORE & _cache_directives(response.headers.get("cache-control", ""))
+        ):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        headers = {k: v for k, v in response.headers.items() if k not in _SKIP_HEADERS}
+        try:
+            await redis.setex(key, self.ttl, _pack(headers, body))
+        except RedisError:
+            pass
+        return Response(body, status_code=response.status_code, headers=headers)
@@ -2,10 +2,23 @@
 # from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 # from base_api.models.user import Base
-# from base_api.settings import BASE_DB_URL, FANBLOG_DB_URL
+# from base_api.settings import (
+#     BASE_DB_URL,
+#     DB_MAX_OVERFLOW,
+#     DB_POOL_RECYCLE,
+#     DB_POOL_SIZE,
+#     FANBLOG_DB_URL,
+# )
 
-# base_engine = create_async_engine(BASE_DB_URL, echo=False)
-# vanblog_engine = create_async_engine(FANBLOG_DB_URL, echo=False)
+# engine_kwargs = dict(
+#     echo=False,
+#     pool_size=DB_POOL_SIZE,
+#     max_overflow=DB_MAX_OVERFLOW,
+#     pool_recycle=DB_POOL_RECYCLE,
+#     pool_pre_ping=True,
+# )
+# base_engine = create_async_engine(BASE_DB_URL, **engine_kwargs)
+# vanblog_engine = create_async_engine(FANBLOG_DB_URL, **engine_kwargs)
 
 # base_async_session = async_sessionmaker(base_engine, expire_on_commit=False)
 # vanblog_async_session = async_sessionmaker(vanblog_engine, expire_on_commit=False)
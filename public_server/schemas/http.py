@@ -1,18 +1,49 @@
 """响应模型"""
-from typing import Generic, Optional, TypeVar
+from typing import Any, Generic, Optional, Type, TypeVar
 
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 from public_server.schemas.response_info import RSINFO
 
 
 T = TypeVar("T")
 
+_OK = RSINFO.OK
+_OK_CODE, _OK_REASON, _OK_MSG = _OK.code, _OK.reason, _OK.message
+
+# 成功响应的固定前缀, ok() 只需序列化 data 部分
+_OK_ENVELOPE = b'{"code":%d,"reason":%s,"message":%s,"data":' % (
+    _OK_CODE,
+    orjson.dumps(_OK_REASON),
+    orjson.dumps(_OK_MSG),
+)
+
+
+# 与 FastAPI 一致: 先由 pydantic 转换为 JSON 兼容的 python 对象, 再按 ORJSONResponse 的选项序列化
+_DATA_ADAPTER: TypeAdapter[Any] = TypeAdapter(Any)
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
 
 class RespModel(BaseModel, Generic[T]):
     """HTTP response model."""
 
-    code: int = RSINFO.OK.code
-    reason: Optional[str] = RSINFO.OK.reason
-    message: Optional[str] = RSINFO.OK.message
+    model_config = ConfigDict(defer_build=False, frozen=True)
+
+    code: int = _OK_CODE
+    reason: Optional[str] = _OK_REASON
+    message: Optional[str] = _OK_MSG
     data: Optional[T] = None
+
+    @classmethod
+    def ok(cls: Type["RespModel"], data: Any = None) -> bytes:
+        """Serialize a success envelope around ``data`` without building a model instance.
+
+        Args:
+                data: The payload to put in the ``data`` field. It is converted by pydantic in JSON mode by alias and dumped with ORJSONResponse's options, so the bytes match a FastAPI route returning ``RespModel(data=data)``.
+
+        Returns:
+                The UTF-8 encoded JSON body, ready for ``Response(..., media_type="application/json")``.
+        """
+        payload = _DATA_ADAPTER.dump_python(data, mode="json", by_alias=True)
+        return _OK_ENVELOPE + orjson.dumps(payload, option=_ORJSON_OPTIONS) + b"}"
@@ -1,8 +1,9 @@
 """响应信息"""
 from typing import Any, List, Optional
 
+import orjson
 from fastapi import status
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class RespInfo(BaseModel):
@@ -13,6 +14,8 @@ class RespInfo(BaseModel):
     message: str = Field(None, description="错误详细信息，可用于显示")
     http_status: int = Field(status.HTTP_400_BAD_REQUEST, description="http 状态码")
 
+    _json: Optional[bytes] = PrivateAttr(None)
+
     def __eq__(self: "RespInfo", other: object) -> bool:
         """Compare two : class : ` Error ` objects for equality. This is useful for determining if a test should be run on an error that is not expected to have been generated by the test code.
 
@@ -51,6 +54,17 @@ class RespInfo(BaseModel):
             other.reason,
         )
 
+    def __setattr__(self: "RespInfo", name: str, value: Any) -> None:
+        """Set an attribute and drop the cached JSON body when a model field changes, so json_bytes() never returns a stale body.
+
+        Args:
+                name: The attribute name.
+                value: The new value.
+        """
+        super().__setattr__(name, value)
+        if name in self.model_fields:
+            self._json = None
+
     def with_message(
         self: "RespInfo", message: str, reason: Optional[str] = None
     ) -> "RespInfo":
@@ -68,6 +82,18 @@ class RespInfo(BaseModel):
             err.reason = reason
         return err
 
+    def json_bytes(self: "RespInfo") -> bytes:
+        """Return the JSON response body of this error, serialized once and cached on the instance.
+
+        Returns:
+                The UTF-8 encoded ``{"code", "reason", "message"}`` body. Assigning a field resets the cache
+        """
+        if self._json is None:
+            self._json = orjson.dumps(
+                {"code": self.code, "reason": self.reason, "message": self.message}
+            )
+        return self._json
+
 
 class NMCException(Exception):
     """未满足条件 NoMeetConditionException"""
@@ -1,10 +1,21 @@
 """ Settings for the application """
 from fastapi.security import OAuth2PasswordBearer
 
-from base_api.utils.env import Env
+from public_server.utils.env import Env
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/users/login")
 
+# CORS
+CORS_ORIGINS = Env.json("CORS_ORIGINS", ["*"])
+if not isinstance(CORS_ORIGINS, list) or not all(
+    isinstance(origin, str) for origin in CORS_ORIGINS
+):
+    raise ValueError(
+        f"CORS_ORIGINS must be a JSON list of strings, got {CORS_ORIGINS!r}"
+    )
+# 鉴权使用 Authorization 头而非 cookie, 默认不需要 credentials
+CORS_ALLOW_CREDENTIALS = Env.boolean("CORS_ALLOW_CREDENTIALS", False)
+
 # MYSQL
 MYSQL_USER = Env.string("MYSQL_USER", "root")
 MYSQL_PASSWORD = Env.string("MYSQL_PASSWORD")
@@ -17,6 +28,9 @@ MYSQL_DB_URL = (
 )
 BASE_DB_URL = MYSQL_DB_URL + MYSQL_DATABASE
 FANBLOG_DB_URL = MYSQL_DB_URL + "fanblog"
+DB_POOL_SIZE = Env.int("DB_POOL_SIZE", 20)
+DB_MAX_OVERFLOW = Env.int("DB_MAX_OVERFLOW", 40)
+DB_POOL_RECYCLE = Env.int("DB_POOL_RECYCLE", 1800)
 
 # REDIS
 REDIS_HOST = Env.string("REDIS_HOST")
@@ -24,6 +38,11 @@ REDIS_PORT = Env.int("REDIS_PORT", 6379)
 REDIS_PASSWORD = Env.string("REDIS_PASSWORD", "melon2021")
 REDIS_RDVS_DB = 9
 REDIS_URL = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/{REDIS_RDVS_DB}"
+REDIS_MAX_CONNECTIONS = Env.int("REDIS_MAX_CONNECTIONS", 64)
+# 连接池取连接及 socket 的超时(秒), redis 不可用时请求尽快回退到处理函数
+REDIS_POOL_TIMEOUT = Env.float("REDIS_POOL_TIMEOUT", 0.2)
+REDIS_SOCKET_TIMEOUT = Env.float("REDIS_SOCKET_TIMEOUT", 0.5)
+RCACHE_TTL = Env.int("RCACHE_TTL", 300)
 
 # TENCENT SMS
 TENCENT_SECRET_ID = Env.string("TENCENT_SECRET_ID")
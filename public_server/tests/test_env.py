@@ -0,0 +1,85 @@
+"""Env 测试"""
+from typing import Iterator
+
+import pytest
+
+from public_server.utils.env import Env
+
+
+@pytest.fixture(autouse=True)
+def clear_env_cache() -> Iterator[None]:
+    """每个测试前后清空 Env 缓存"""
+    Env.clear_cache()
+    yield
+    Env.clear_cache()
+
+
+def test_values_are_cached_until_cleared(monkeypatch: pytest.MonkeyPatch) -> None:
+    """缓存生效, clear_cache() 后重新读取环境变量"""
+    monkeypatch.setenv("ENV_TEST_INT", "1")
+    assert Env.int("ENV_TEST_INT") == 1
+
+    monkeypatch.setenv("ENV_TEST_INT", "2")
+    assert Env.int("ENV_TEST_INT") == 1
+
+    Env.clear_cache()
+    assert Env.int("ENV_TEST_INT") == 2
+
+
+def test_json_values_are_not_shared(monkeypatch: pytest.MonkeyPatch) -> None:
+    """每次调用返回新解析的对象"""
+    monkeypatch.setenv("ENV_TEST_JSON", "[1]")
+    Env.json("ENV_TEST_JSON", []).append(2)
+    assert Env.json("ENV_TEST_JSON", []) == [1]
+
+
+def test_missing_value_uses_default() -> None:
+    """未设置时返回默认值"""
+    assert Env.int("ENV_TEST_MISSING", 3) == 3
+    assert Env.string("ENV_TEST_MISSING", "x") == "x"
+
+
+def test_auto_load_matches_full_module_prefix(monkeypatch: pytest.MonkeyPatch) -> None:
+    """a.b 只加载 a__b__ 前缀的变量, 不会匹配 a__bc__"""
+    monkeypatch.setenv("envtest__b__X", "[1, 2]")
+    monkeypatch.setenv("envtest__b__S", "from env")
+    monkeypatch.setenv("envtest__bc__X", "9")
+    monkeypatch.setenv("envtest__b__a__Y", "nested")
+    settings = {"X": [0], "S": "default"}
+
+    Env.auto_load("envtest.b", settings)
+
+    assert settings == {"X": [1, 2], "S": "from env"}
+
+
+def test_auto_load_literal_eval_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """非 JSON 值回退到 ast.literal_eval"""
+    monkeypatch.setenv("envtest__b__T", "(1, 2)")
+    settings = {"T": (0,)}
+
+    Env.auto_load("envtest.b", settings)
+
+    assert settings == {"T": (1, 2)}
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1", True),
+        ("true", True),
+        ("TRUE", True),
+        ("Yes", True),
+        ("on", True),
+        ("y", True),
+        ("t", True),
+        ("", False),
+        ("yellow", False),
+        ("0", False),
+        ("false", False),
+        ("off", False),
+    ],
+)
+def test_boolean(monkeypatch: pytest.MonkeyPatch, value: str, expected: bool) -> None:
+    """布尔值解析, 包括新增的 on/y/t 和被拒绝的空串/前缀匹配"""
+    monkeypatch.setenv("ENV_TEST_BOOL", value)
+    assert Env.boolean("ENV_TEST_BOOL", default=not expected) is expected
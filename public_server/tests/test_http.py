@@ -0,0 +1,66 @@
+"""RespModel 测试"""
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field, field_serializer
+
+from public_server.schemas.http import RespModel
+
+
+class Item(BaseModel):
+    """带别名和自定义序列化的模型"""
+
+    item_id: int = Field(alias="itemId")
+    price: Decimal
+    tags: set
+
+    @field_serializer("item_id")
+    def serialize_item_id(self: "Item", value: int) -> str:
+        return f"item-{value}"
+
+
+PAYLOADS = [
+    None,
+    1,
+    1.5,
+    "中文",
+    [1, "a"],
+    {1: "a"},
+    {"s"},
+    Decimal("1.5"),
+    datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    UUID("12345678-1234-5678-1234-567812345678"),
+    Item(itemId=1, price=Decimal("9.90"), tags={"x"}),
+    {"items": [Item(itemId=2, price=Decimal("1"), tags=set())]},
+]
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """与 main.py 一致使用 ORJSONResponse 的应用, /typed 通过返回注解推断 response_model"""
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.state.payload = None
+
+    @app.get("/untyped")
+    async def untyped() -> Any:
+        return RespModel(data=app.state.payload)
+
+    @app.get("/typed")
+    async def typed() -> RespModel:
+        return RespModel(data=app.state.payload)
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/untyped", "/typed"])
+@pytest.mark.parametrize("payload", PAYLOADS, ids=repr)
+def test_ok_matches_fastapi(client: TestClient, path: str, payload: Any) -> None:
+    """ok() 的输出与 FastAPI 返回 RespModel(data=...) 的响应体逐字节一致"""
+    client.app.state.payload = payload
+    assert RespModel.ok(payload) == client.get(path).content
@@ -0,0 +1,199 @@
+"""RCacheMiddleware 测试"""
+from typing import Any, Dict, List, Optional
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+from starlette.middleware.cors import CORSMiddleware
+
+from public_server.middleware.rcache import RCacheMiddleware
+
+
+class FakePipeline:
+    """只实现中间件用到的 get/ttl/execute"""
+
+    def __init__(self: "FakePipeline", redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.ops: List[Any] = []
+
+    async def __aenter__(self: "FakePipeline") -> "FakePipeline":
+        return self
+
+    async def __aexit__(self: "FakePipeline", *args: Any) -> None:
+        pass
+
+    def get(self: "FakePipeline", key: str) -> "FakePipeline":
+        self.ops.append(self.redis.data.get(key))
+        return self
+
+    def ttl(self: "FakePipeline", key: str) -> "FakePipeline":
+        self.ops.append(self.redis.ttls.get(key, -2))
+        return self
+
+    async def execute(self: "FakePipeline") -> List[Any]:
+        if self.redis.broken:
+            raise RedisConnectionError("redis down")
+        return self.ops
+
+
+class FakeRedis:
+    """内存版 redis 客户端"""
+
+    def __init__(self: "FakeRedis", broken: bool = False) -> None:
+        self.data: Dict[str, bytes] = {}
+        self.ttls: Dict[str, int] = {}
+        self.broken = broken
+
+    def pipeline(self: "FakeRedis", transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def setex(self: "FakeRedis", key: str, ttl: int, value: bytes) -> None:
+        if self.broken:
+            raise RedisConnectionError("redis down")
+        self.data[key] = value
+        self.ttls[key] = ttl - 10
+
+
+def make_client(redis: Optional[FakeRedis]) -> TestClient:
+    """创建挂载 RCacheMiddleware 和 CORSMiddleware 的测试应用"""
+    app = FastAPI()
+    app.state.redis = redis
+    app.state.calls = 0
+    app.add_middleware(RCacheMiddleware, ttl=300)
+    app.add_middleware(CORSMiddleware, allow_origins=["*"])
+
+    @app.get("/json")
+    async def json_route(response: Response) -> Dict[str, int]:
+        app.state.calls += 1
+        response.headers["x-custom"] = "1"
+        return {"calls": app.state.calls}
+
+    @app.post("/json")
+    async def json_post() -> Dict[str, int]:
+        app.state.calls += 1
+        return {"calls": app.state.calls}
+
+    @app.get("/html")
+    async def html_route() -> Response:
+        app.state.calls += 1
+        return Response(b"<h1>hi</h1>", media_type="text/html")
+
+    @app.get("/private")
+    async def private_route(response: Response) -> Dict[str, int]:
+        app.state.calls += 1
+        response.headers["cache-control"] = "private, max-age=0"
+        return {"calls": app.state.calls}
+
+    @app.get("/nostore")
+    async def nostore_route(response: Response) -> Dict[str, int]:
+        app.state.calls += 1
+        response.headers["cache-control"] = "No-Store"
+        return {"calls": app.state.calls}
+
+    @app.get("/missing")
+    async def missing_route() -> Response:
+        app.state.calls += 1
+        return Response(b"{}", status_code=404, media_type="application/json")
+
+    return TestClient(app)
+
+
+def test_miss_then_hit() -> None:
+    """首次请求写入缓存, 再次请求命中缓存且保留响应头和 CORS 头"""
+    redis = FakeRedis()
+    client = make_client(redis)
+
+    first = client.get("/json", headers={"Origin": "http://a.com"})
+    assert first.json() == {"calls": 1}
+    assert len(redis.data) == 1
+
+    second = client.get("/json", headers={"Origin": "http://a.com"})
+    assert second.json() == {"calls": 1}
+    assert second.headers["content-type"] == "application/json"
+    assert second.headers["x-custom"] == "1"
+    assert second.headers["access-control-allow-origin"] == "*"
+    assert second.headers["age"] == "10"
+
+
+def test_auth_header_is_part_of_key() -> None:
+    """不同 Authorization 的请求不共享缓存"""
+    redis = FakeRedis()
+    client = make_client(redis)
+
+    client.get("/json", headers={"Authorization": "Bearer a"})
+    resp = client.get("/json", headers={"Authorization": "Bearer b"})
+    assert resp.json() == {"calls": 2}
+    assert len(redis.data) == 2
+
+
+@pytest.mark.parametrize(
+    "method, path",
+    [
+        ("post", "/json"),
+        ("get", "/html"),
+        ("get", "/missing"),
+        ("get", "/private"),
+        ("get", "/nostore"),
+    ],
+)
+def test_passthrough_not_cached(method: str, path: str) -> None:
+    """非 GET, 非 JSON, 非 200 和 Cache-Control 禁止缓存的响应不写入缓存"""
+    redis = FakeRedis()
+    client = make_client(redis)
+
+    getattr(client, method)(path)
+    getattr(client, method)(path)
+    assert client.app.state.calls == 2
+    assert not redis.data
+
+
+def test_redis_error_falls_through() -> None:
+    """redis 不可用时直接调用处理函数"""
+    client = make_client(FakeRedis(broken=True))
+
+    assert client.get("/json").json() == {"calls": 1}
+    assert client.get("/json").json() == {"calls": 2}
+
+
+def test_no_redis_client() -> None:
+    """未初始化 redis 时透传请求"""
+    client = make_client(None)
+
+    assert client.get("/json").json() == {"calls": 1}
+    assert client.get("/json").json() == {"calls": 2}
+
+
+def test_request_no_cache_refreshes() -> None:
+    """请求带 no-cache 时跳过缓存读取, 并用新响应刷新缓存"""
+    redis = FakeRedis()
+    client = make_client(redis)
+
+    client.get("/json")
+    resp = client.get("/json", headers={"Cache-Control": "no-cache"})
+    assert resp.json() == {"calls": 2}
+    assert client.get("/json").json() == {"calls": 2}
+
+
+def test_request_no_store_bypasses_cache() -> None:
+    """请求带 no-store 时不读也不写缓存"""
+    redis = FakeRedis()
+    client = make_client(redis)
+
+    assert client.get("/json", headers={"Cache-Control": "no-store"}).json() == {
+        "calls": 1
+    }
+    assert not redis.data
+
+
+@pytest.mark.parametrize("value", [b"no newline", b"not json\n{}", b"[1]\n{}"])
+def test_malformed_entry_is_a_miss(value: bytes) -> None:
+    """格式不正确的缓存值视为未命中, 并被新响应覆盖"""
+    redis = FakeRedis()
+    client = make_client(redis)
+    client.get("/json")
+    (key,) = redis.data
+    redis.data[key] = value
+
+    assert client.get("/json").json() == {"calls": 2}
+    assert client.get("/json").json() == {"calls": 2}
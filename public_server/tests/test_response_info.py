@@ -0,0 +1,32 @@
+"""RespInfo 测试"""
+import orjson
+
+from public_server.schemas.response_info import RSINFO, RespInfo
+
+
+def test_json_bytes() -> None:
+    """序列化 code/reason/message"""
+    err = RSINFO.err(1, "R", "消息")
+    assert orjson.loads(err.json_bytes()) == {"code": 1, "reason": "R", "message": "消息"}
+    assert err.json_bytes() is err.json_bytes()
+
+
+def test_json_bytes_reset_on_assignment() -> None:
+    """修改字段后重新序列化"""
+    err = RSINFO.err(1, "R", "old")
+    err.json_bytes()
+
+    err.message = "new"
+    err.reason = "R2"
+    assert orjson.loads(err.json_bytes()) == {"code": 1, "reason": "R2", "message": "new"}
+
+
+def test_with_message_does_not_touch_original() -> None:
+    """with_message 返回新的序列化结果, 原对象不变"""
+    original = RespInfo(code=2, reason="R", message="m")
+    original.json_bytes()
+
+    copy = original.with_message("x", reason="Y")
+    assert orjson.loads(copy.json_bytes())["message"] == "x"
+    assert orjson.loads(copy.json_bytes())["reason"] == "Y"
+    assert orjson.loads(original.json_bytes())["message"] == "m"
@@ -1,18 +1,47 @@
 """环境变量工具类实现"""
+import ast
 import json
 import os
+import sys
 from enum import Enum
-from typing import Any, Callable, Optional, Type, TypeVar
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
 
 __all__ = ["Env"]
 
 T = TypeVar("T")
 ENUM = TypeVar("ENUM", bound=Enum)
 
+# 环境变量原始字符串缓存, 未设置的变量记为 None; 每次调用仍由 loader 解析, 不共享可变对象
+_ENV_CACHE: Dict[str, Optional[str]] = {}
+
+_TRUTHY = frozenset({"true", "1", "yes", "on", "y", "t"})
+
+
+def _parse_bool(v: str) -> bool:
+    """解析布尔值, 已是小写的常见取值不做 lower()"""
+    return v in _TRUTHY or v.lower() in _TRUTHY
+
+
+def _enum_coerce(enum_class: Type[ENUM], base: type, v: str) -> ENUM:
+    """先转换为枚举的基础类型(如 str, int), 再构造枚举值"""
+    return enum_class(base(v))
+
+
+@lru_cache(maxsize=None)
+def _enum_loader(enum_class: Type[ENUM]) -> Callable[[str], ENUM]:
+    """每个枚举类只解析一次 mro, 并复用同一个 loader"""
+    return partial(_enum_coerce, enum_class, enum_class.mro()[1])
+
 
 class Env:
     """环境变量工具类，用于从环境变量中加载配置"""
 
+    @classmethod
+    def clear_cache(cls: Type["Env"]) -> None:
+        """Forget cached environment values so the next load reads os.environ again. Useful after monkeypatch.setenv in tests."""
+        _ENV_CACHE.clear()
+
     @classmethod
     def general_loader(
         cls: Type["Env"],
@@ -22,7 +51,7 @@ class Env:
         description: Optional[str] = None,
         contains_secret: bool = False,
     ) -> T:
-        """Load value from environment variable. This is a general loader that does not check for None values. If it's None it will return the default value
+        """Load value from environment variable. This is a general loader that does not check for None values. If it's None it will return the default value. Raw values are cached per name, so later changes to os.environ are not picked up until Env.clear_cache() is called
 
         Args:
                 cls: Type [ Env ] The class to use for this loader
@@ -35,15 +64,11 @@ class Env:
         Returns:
                 The value loaded from the environment or default if not found.
         """
-        value_str: Optional[str] = os.getenv(name, None)
+        try:
+            value_str: Optional[str] = _ENV_CACHE[name]
+        except KeyError:
+            value_str = _ENV_CACHE[name] = os.getenv(name, None)
         value: T = loader(value_str) if value_str is not None else default
-
-        log_value = value
-        if contains_secret:
-            if log_value and isinstance(log_value, str) and len(log_value) > 10:
-                log_value = log_value[:4] + "**" + log_value[-4:]
-            else:
-                log_value = "**"
         return value
 
     @classmethod
@@ -68,7 +93,7 @@ class Env:
         """
         return cls.general_loader(
             name=name,
-            loader=lambda v: int(v),
+            loader=int,
             default=default,
             description=description,
             contains_secret=contains_secret,
@@ -96,7 +121,7 @@ class Env:
         """
         return cls.general_loader(
             name=name,
-            loader=lambda v: float(v),
+            loader=float,
             default=default,
             description=description,
             contains_secret=contains_secret,
@@ -124,7 +149,7 @@ class Env:
         """
         return cls.general_loader(
             name=name,
-            loader=lambda v: json.loads(v),
+            loader=json.loads,
             default=default,
             description=description,
             contains_secret=contains_secret,
@@ -153,7 +178,7 @@ class Env:
         """
         return cls.general_loader(
             name=name,
-            loader=lambda v: str(v),
+            loader=str,
             default=default,
             description=description,
             contains_secret=contains_secret,
@@ -183,7 +208,7 @@ class Env:
         """
         return cls.general_loader(
             name=name,
-            loader=lambda v: enum_class(enum_class.mro()[1](v)),
+            loader=_enum_loader(enum_class),
             default=default,
             description=description,
             contains_secret=contains_secret,
@@ -212,7 +237,7 @@ class Env:
         """
         return cls.general_loader(
             name=name,
-            loader=lambda v: v.lower() in {"true", "1", "yes"},
+            loader=_parse_bool,
             default=default,
             description=description,
             contains_secret=contains_secret,
@@ -231,17 +256,15 @@ class Env:
             settings (Any, optional): settings package, e.g. globals()
         """
         if name is None or settings is None:
-            import inspect
-
-            stack = inspect.stack()
+            frame = sys._getframe(1)
             try:
-                f_locals = stack[1][0].f_locals
+                f_locals = frame.f_locals
                 if name is None:
                     name = f_locals["__name__"]
                 if settings is None:
                     settings = f_locals
             finally:
-                del stack
+                del frame
 
         if "." not in str(name):
             raise Exception(
@@ -249,12 +272,13 @@ class Env:
             )
 
         sep = "__"
-        settings_prefix = str(name).replace(".", sep)
-        # print('load settings from env for %s' % settings_prefix)
+        prefix = str(name).replace(".", sep) + sep
+        plen = len(prefix)
+        # print('load settings from env for %s' % prefix)
         for key, value in os.environ.items():
-            if not key.startswith(settings_prefix):
+            if not key.startswith(prefix):
                 continue
-            key = key[len(settings_prefix) + len(sep) :]
+            key = key[plen:]
             if not key or sep in key:
                 continue
             if (
@@ -265,8 +289,6 @@ class Env:
                 try:
                     value = json.loads(value)
                 except Exception:
-                    import ast
-
                     value = ast.literal_eval(value)
 
             settings[key] = value